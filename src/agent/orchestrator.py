@@ -1,16 +1,19 @@
 """Agent orchestrator with simple intent routing (no AgentExecutor dependency)."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class AgentOrchestrator:
     """Main agent orchestrator using simple heuristics to route intents."""
     
-    def __init__(self, rag_tool, ticket_tool):
+    def __init__(self, rag_tool, ticket_tool, corpus_registry=None):
         self.rag_tool = rag_tool
         self.ticket_tool = ticket_tool
+        self.corpus_registry = corpus_registry
 
-    def _looks_like_ticket_request(self, text: str) -> bool:
+    @staticmethod
+    def is_ticket_request(text: str) -> bool:
+        """Return True if the input is routed to the ticket tool rather than RAG."""
         t = text.lower()
         keywords = [
             "ticket", "create ticket", "open ticket", "helpdesk",
@@ -36,10 +39,23 @@ class AgentOrchestrator:
             category = "general"
         return {"subject": subject, "description": description, "priority": priority, "category": category}
 
-    def process(self, user_input: str) -> Dict[str, Any]:
-        """Process user input and return response."""
+    def _rag_tool_for(self, corpus: Optional[str]):
+        """Pick the RAG index for a corpus id, or the default tool when none is given."""
+        if corpus is None:
+            if self.rag_tool is None:
+                raise ValueError("No default policy index configured; pass a corpus")
+            return self.rag_tool
+        if self.corpus_registry is None:
+            raise ValueError(f"Corpus '{corpus}' requested but no corpus registry is configured")
+        return self.corpus_registry.get(corpus)
+
+    def process(self, user_input: str, corpus: Optional[str] = None) -> Dict[str, Any]:
+        """Process user input and return response.
+
+        ``corpus`` selects a department/tenant policy index from the corpus registry.
+        """
         try:
-            if self._looks_like_ticket_request(user_input):
+            if self.is_ticket_request(user_input):
                 fields = self._extract_ticket_fields(user_input)
                 ticket = self.ticket_tool.create_ticket(
                     subject=fields["subject"],
@@ -52,7 +68,7 @@ class AgentOrchestrator:
                     "success": True,
                 }
             # Otherwise query policies via RAG
-            result = self.rag_tool.query(user_input)
+            result = self._rag_tool_for(corpus).query(user_input)
             answer = result.get("answer", "I couldn't find an answer.")
             sources = ", ".join(result.get("sources", []))
             return {
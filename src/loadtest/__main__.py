@@ -0,0 +1,7 @@
+"""Entry point for ``python -m src.loadtest``."""
+
+import sys
+
+from src.loadtest.runner import main
+
+sys.exit(main())
@@ -0,0 +1,298 @@
+"""Load generator that drives AgentOrchestrator.process concurrently.
+
+Runs fully offline: policy answers go to a local OpenAI-compatible stub server
+and tickets are written to a scratch file unless one is given explicitly.
+
+Usage:
+    python -m src.loadtest --workload data/loadtest/workload.txt --concurrency 16 --requests 500
+    python -m src.loadtest --rate 50 --duration 30 --latency-ms 120 --error-rate 0.02
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional
+
+from src.agent.orchestrator import AgentOrchestrator
+from src.loadtest.stub_server import StubLLMServer
+
+
+def load_workload(path: str, classify: Callable[[str], bool] = AgentOrchestrator.is_ticket_request) -> List[Dict[str, str]]:
+    """Load queries, one per line; blank lines and lines starting with '#' are skipped.
+
+    A line may start with ``ticket:`` or ``policy:`` to label its kind explicitly;
+    otherwise ``classify`` (the orchestrator's routing check) decides.
+    """
+    entries: List[Dict[str, str]] = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            prefix, sep, rest = line.partition(":")
+            if sep and prefix.strip().lower() in ("ticket", "policy") and rest.strip():
+                entries.append({"kind": prefix.strip().lower(), "query": rest.strip()})
+            else:
+                entries.append({"kind": "ticket" if classify(line) else "policy", "query": line})
+    if not entries:
+        raise ValueError(f"No queries found in {path}")
+    return entries
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def run_load_test(
+    orchestrator,
+    workload: List[Dict[str, str]],
+    concurrency: int = 8,
+    rate: Optional[float] = None,
+    total_requests: Optional[int] = None,
+    duration: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Replay workload entries against the orchestrator and collect per-request samples.
+
+    Without ``rate`` this is a closed loop: ``concurrency`` workers each send the
+    next query as soon as their previous one returns. With ``rate`` requests are
+    issued on a fixed schedule (open loop) and latency is measured from the
+    scheduled start, so queueing delay behind busy workers is counted.
+    """
+    if total_requests is None and duration is None:
+        total_requests = len(workload)
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    samples: List[Dict[str, Any]] = []
+    samples_lock = threading.Lock()
+
+    def execute(index: int, scheduled: float):
+        entry = workload[index % len(workload)]
+        kind = entry["kind"]
+        try:
+            result = orchestrator.process(entry["query"])
+            success = bool(result.get("success"))
+        except Exception:
+            success = False
+        latency = time.perf_counter() - scheduled
+        with samples_lock:
+            samples.append({"kind": kind, "latency": latency, "success": success})
+
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else None
+
+    def has_budget(index: int) -> bool:
+        if total_requests is not None and index >= total_requests:
+            return False
+        if deadline is not None and time.perf_counter() >= deadline:
+            return False
+        return True
+
+    if rate is None:
+        next_index = [0]
+        index_lock = threading.Lock()
+
+        def worker():
+            while True:
+                with index_lock:
+                    index = next_index[0]
+                    if not has_budget(index):
+                        return
+                    next_index[0] += 1
+                execute(index, time.perf_counter())
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    else:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        interval = 1.0 / rate
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            index = 0
+            while has_budget(index):
+                scheduled = started + index * interval
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                    if not has_budget(index):
+                        break
+                pool.submit(execute, index, scheduled)
+                index += 1
+
+    elapsed = time.perf_counter() - started
+    return {"samples": samples, "elapsed": elapsed, "concurrency": concurrency, "rate": rate}
+
+
+def check_ticket_integrity(tickets_file: str, expected_new: int, baseline_count: int = 0) -> Dict[str, Any]:
+    """Verify the tickets file after a run: valid JSON, unique IDs, no lost writes."""
+    report: Dict[str, Any] = {"valid_json": True, "duplicate_ids": [], "expected": baseline_count + expected_new}
+    try:
+        with open(tickets_file, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        report.update({"valid_json": False, "error": str(e), "actual": 0, "ok": False})
+        return report
+
+    ids = [t.get("id") for t in data.get("tickets", [])]
+    report["actual"] = len(ids)
+    report["duplicate_ids"] = sorted(i for i, n in Counter(ids).items() if n > 1)
+    report["ok"] = not report["duplicate_ids"] and report["actual"] == report["expected"]
+    return report
+
+
+def _count_tickets(tickets_file: str) -> int:
+    with open(tickets_file, 'r') as f:
+        return len(json.load(f).get("tickets", []))
+
+
+def summarize(run: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute throughput, latency percentiles and error rate, overall and per kind."""
+    def stats(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        latencies = sorted(s["latency"] * 1000.0 for s in samples)
+        errors = sum(1 for s in samples if not s["success"])
+        count = len(samples)
+        return {
+            "requests": count,
+            "errors": errors,
+            "error_rate": errors / count if count else 0.0,
+            "latency_ms": {
+                "mean": sum(latencies) / count if count else 0.0,
+                "p50": percentile(latencies, 50),
+                "p90": percentile(latencies, 90),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": latencies[-1] if latencies else 0.0,
+            },
+        }
+
+    samples = run["samples"]
+    summary = stats(samples)
+    summary["elapsed_s"] = run["elapsed"]
+    summary["throughput_rps"] = len(samples) / run["elapsed"] if run["elapsed"] > 0 else 0.0
+    summary["by_kind"] = {
+        kind: stats([s for s in samples if s["kind"] == kind])
+        for kind in sorted({s["kind"] for s in samples})
+    }
+    return summary
+
+
+def format_report(summary: Dict[str, Any], integrity: Optional[Dict[str, Any]] = None) -> str:
+    """Render a summary as a plain-text report."""
+    def latency_line(lat: Dict[str, float]) -> str:
+        return (
+            f"mean {lat['mean']:.1f} | p50 {lat['p50']:.1f} | p90 {lat['p90']:.1f} | "
+            f"p95 {lat['p95']:.1f} | p99 {lat['p99']:.1f} | max {lat['max']:.1f} ms"
+        )
+
+    lines = [
+        "Load test results",
+        f"  Requests:   {summary['requests']} in {summary['elapsed_s']:.2f}s",
+        f"  Throughput: {summary['throughput_rps']:.2f} req/s",
+        f"  Errors:     {summary['errors']} ({summary['error_rate']:.2%})",
+        f"  Latency:    {latency_line(summary['latency_ms'])}",
+    ]
+    for kind, stats in summary["by_kind"].items():
+        lines.append(f"  [{kind}] {stats['requests']} req, {stats['error_rate']:.2%} errors, {latency_line(stats['latency_ms'])}")
+    if integrity is not None:
+        status = "OK" if integrity["ok"] else "FAILED"
+        lines.append(
+            f"  Ticket integrity: {status} (expected {integrity['expected']}, found {integrity['actual']}, "
+            f"duplicate IDs: {len(integrity['duplicate_ids'])}, valid JSON: {integrity['valid_json']})"
+        )
+        if integrity["duplicate_ids"]:
+            lines.append(f"    Duplicates: {', '.join(integrity['duplicate_ids'][:10])}")
+    stub = summary.get("stub")
+    if stub is not None:
+        lines.append(
+            f"  Stub LLM:   {stub['requests_served']} calls, {stub['errors_injected']} injected errors "
+            f"(errors above are counted after {stub['llm_retries']} client retries)"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline load test for the agent orchestrator.")
+    parser.add_argument("--workload", default="./data/loadtest/workload.txt", help="File with one query per line")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent workers (closed loop) or max in flight (with --rate)")
+    parser.add_argument("--rate", type=float, default=None, help="Target requests per second (open loop)")
+    parser.add_argument("--requests", type=int, default=None, help="Total requests to send")
+    parser.add_argument("--duration", type=float, default=None, help="Run for this many seconds")
+    parser.add_argument("--policies", default="./data/policies", help="Policy documents directory")
+    parser.add_argument("--tickets-file", default=None, help="Tickets file (defaults to a scratch file)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Stub LLM latency per call")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter on stub latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub calls that return HTTP 500")
+    parser.add_argument("--llm-retries", type=int, default=2,
+                        help="LLM client retries per call (2 is the SDK default; 0 exposes raw stub errors)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for stub latency/error injection")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point; returns a non-zero exit code if data integrity checks fail."""
+    args = _parse_args(argv)
+    workload = load_workload(args.workload)
+
+    with StubLLMServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    ) as stub, tempfile.TemporaryDirectory() as scratch:
+        # Route every LLM call to the stub; the OpenAI path honours OPENAI_BASE_URL
+        os.environ.pop("DEEPSEEK_API_KEY", None)
+        os.environ["OPENAI_API_KEY"] = "stub-key"
+        os.environ["OPENAI_BASE_URL"] = stub.base_url
+        os.environ["LLM_MAX_RETRIES"] = str(args.llm_retries)
+
+        from src.tools.rag_tool import RAGTool
+        from src.tools.ticket_tool import TicketTool
+
+        tickets_file = args.tickets_file or os.path.join(scratch, "tickets.json")
+        rag_tool = RAGTool()
+        rag_tool.initialize_vector_store(args.policies)
+        ticket_tool = TicketTool(tickets_file)
+        baseline_count = _count_tickets(tickets_file)
+        orchestrator = AgentOrchestrator(rag_tool, ticket_tool)
+
+        run = run_load_test(
+            orchestrator,
+            workload,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            total_requests=args.requests,
+            duration=args.duration,
+        )
+        summary = summarize(run)
+        created = sum(1 for s in run["samples"] if s["kind"] == "ticket" and s["success"])
+        integrity = check_ticket_integrity(tickets_file, created, baseline_count)
+        summary["stub"] = {
+            "requests_served": stub.requests_served,
+            "errors_injected": stub.errors_injected,
+            "llm_retries": args.llm_retries,
+        }
+
+    if args.json:
+        print(json.dumps({"summary": summary, "ticket_integrity": integrity}, indent=2))
+    else:
+        print(format_report(summary, integrity))
+    return 0 if integrity["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
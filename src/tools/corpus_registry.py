@@ -0,0 +1,168 @@
+"""Registry of per-corpus RAG indexes with lazy loading and LRU eviction."""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from src.tools.rag_tool import RAGTool
+
+
+class _PendingBuild:
+    """An index build in progress; other callers for the same corpus wait on it."""
+
+    def __init__(self, documents_path: str):
+        self.documents_path = documents_path
+        self.done = threading.Event()
+        self.tool: Optional["RAGTool"] = None
+        self.error: Optional[BaseException] = None
+
+
+class CorpusRegistry:
+    """Maps a corpus/tenant id (e.g. "hr", "finance-emea") to its own RAG index.
+
+    Indexes are built on first use and kept in LRU order. When the estimated
+    size of loaded indexes exceeds ``max_memory_bytes`` the least recently used
+    ones are dropped and rebuilt on their next query. Concurrent queries for a
+    corpus that is still being built share a single build.
+    """
+
+    def __init__(
+        self,
+        corpora: Optional[Dict[str, str]] = None,
+        max_memory_bytes: int = 512 * 1024 * 1024,
+        rag_tool_factory: Optional[Callable[[], "RAGTool"]] = None,
+    ):
+        if rag_tool_factory is None:
+            # Imported lazily so the registry itself does not pull in numpy/sklearn/openai
+            from src.tools.rag_tool import RAGTool
+            rag_tool_factory = RAGTool
+        self.max_memory_bytes = max_memory_bytes
+        self.rag_tool_factory = rag_tool_factory
+        self._paths: Dict[str, str] = dict(corpora or {})
+        self._indexes: "OrderedDict[str, RAGTool]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._pending: Dict[str, _PendingBuild] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_directory(cls, root: str, **kwargs) -> "CorpusRegistry":
+        """Register every subdirectory of ``root`` that contains .txt files as a corpus."""
+        corpora = {}
+        for name in sorted(os.listdir(root)):
+            path = os.path.join(root, name)
+            if os.path.isdir(path) and any(f.endswith('.txt') for f in os.listdir(path)):
+                corpora[name] = path
+        return cls(corpora, **kwargs)
+
+    def register(self, corpus_id: str, documents_path: str):
+        """Register (or re-point) a corpus; a loaded index for it is dropped."""
+        with self._lock:
+            self._paths[corpus_id] = documents_path
+            self._drop(corpus_id)
+
+    def corpora(self) -> List[str]:
+        """Return registered corpus ids."""
+        with self._lock:
+            return sorted(self._paths)
+
+    def loaded(self) -> List[str]:
+        """Return ids of currently loaded indexes, least recently used first."""
+        with self._lock:
+            return list(self._indexes)
+
+    def memory_bytes(self) -> int:
+        """Estimated total size of loaded indexes."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def get(self, corpus_id: str) -> "RAGTool":
+        """Return the index for ``corpus_id``, building it if it is not loaded."""
+        with self._lock:
+            if corpus_id not in self._paths:
+                raise ValueError(f"Unknown corpus: {corpus_id}")
+            tool = self._indexes.get(corpus_id)
+            if tool is not None:
+                self._indexes.move_to_end(corpus_id)
+                self.hits += 1
+                return tool
+            documents_path = self._paths[corpus_id]
+            pending = self._pending.get(corpus_id)
+            # A build for a path the corpus no longer points at must not be joined
+            owner = pending is None or pending.documents_path != documents_path
+            if owner:
+                pending = _PendingBuild(documents_path)
+                self._pending[corpus_id] = pending
+                self.misses += 1
+
+        if not owner:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.tool
+
+        try:
+            tool = self.rag_tool_factory()
+            tool.initialize_vector_store(documents_path)
+            size = tool.estimated_memory_bytes()
+        except BaseException as e:
+            with self._lock:
+                self._finish(corpus_id, pending)
+            pending.error = e
+            pending.done.set()
+            raise
+
+        with self._lock:
+            self._finish(corpus_id, pending)
+            # Skip caching if the corpus was re-pointed while we were building
+            if self._paths.get(corpus_id) == documents_path:
+                self._indexes[corpus_id] = tool
+                self._sizes[corpus_id] = size
+                self._evict_over_budget()
+        pending.tool = tool
+        pending.done.set()
+        return tool
+
+    def query(self, corpus_id: str, question: str) -> dict:
+        """Query a corpus by id."""
+        return self.get(corpus_id).query(question)
+
+    def evict(self, corpus_id: str):
+        """Drop a loaded index; it is rebuilt on next use."""
+        with self._lock:
+            self._drop(corpus_id)
+
+    def _finish(self, corpus_id: str, pending: _PendingBuild):
+        # Callers must hold self._lock. A newer build may have replaced ours.
+        if self._pending.get(corpus_id) is pending:
+            del self._pending[corpus_id]
+
+    def _drop(self, corpus_id: str):
+        # Callers must hold self._lock. In-flight queries keep their own reference.
+        self._indexes.pop(corpus_id, None)
+        self._sizes.pop(corpus_id, None)
+
+    def _evict_over_budget(self):
+        # Callers must hold self._lock. The most recently used index is always kept,
+        # even if it alone exceeds the budget.
+        while len(self._indexes) > 1 and sum(self._sizes.values()) > self.max_memory_bytes:
+            oldest = next(iter(self._indexes))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Return cache statistics."""
+        with self._lock:
+            return {
+                "registered": len(self._paths),
+                "loaded": list(self._indexes),
+                "memory_bytes": sum(self._sizes.values()),
+                "max_memory_bytes": self.max_memory_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
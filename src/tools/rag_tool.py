@@ -1,6 +1,7 @@
 """RAG Tool for policy information retrieval (Windows-friendly, no heavy deps)."""
 
 import os
+import sys
 from typing import List, Tuple
 import numpy as np
 from src.utils.llm_config import get_embeddings, get_chat_llm
@@ -15,12 +16,14 @@ class RAGTool:
         self.texts: List[str] = []
         self.metadatas: List[dict] = []
         self.doc_vectors: np.ndarray | None = None
+        self.documents_path = "./data/policies"
         
     def initialize_vector_store(self, documents_path: str = "./data/policies"):
         """Initialize the vector store with policy documents (manual loader/splitter)."""
         texts, metadatas = self._load_and_chunk_documents(documents_path)
         if not texts:
             raise ValueError(f"No documents found in {documents_path}")
+        self.documents_path = documents_path
 
         # Build in-memory TF-IDF matrix (no FAISS/torch/onnx)
         self.texts = texts
@@ -61,7 +64,7 @@ class RAGTool:
         """Query the knowledge base without langchain.chains dependency."""
         # Ensure index
         if self.doc_vectors is None or len(self.texts) == 0:
-            self.initialize_vector_store()
+            self.initialize_vector_store(self.documents_path)
 
         # Retrieve relevant documents using cosine similarity
         qvec = np.asarray(self.embeddings.embed_query(question), dtype=np.float32)
@@ -91,6 +94,21 @@ class RAGTool:
             "sources": [self.metadatas[i].get("source", "Unknown") for i in top_idx],
         }
     
+    def estimated_memory_bytes(self) -> int:
+        """Rough in-memory size of the loaded index (vectors, chunk texts, vocabulary)."""
+        total = 0
+        if self.doc_vectors is not None:
+            total += int(self.doc_vectors.nbytes)
+        total += sum(sys.getsizeof(t) for t in self.texts)
+        total += sum(sys.getsizeof(m) for m in self.metadatas)
+        vectorizer = getattr(self.embeddings, "vectorizer", None)
+        vocabulary = getattr(vectorizer, "vocabulary_", None)
+        if vocabulary:
+            # term string + dict slot + idf weight, approximately
+            total += sum(sys.getsizeof(term) + 16 for term in vocabulary)
+            total += len(vocabulary) * 8
+        return total
+
     def get_tool_description(self) -> str:
         """Return tool description for agent."""
         return """Use this tool to answer questions about company policies, including:
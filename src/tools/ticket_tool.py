@@ -1,51 +1,114 @@
 """Ticket creation tool for helpdesk automation."""
 
 from typing import Dict, List
+from contextlib import contextmanager
 from datetime import datetime
 import json
 import os
+import stat
+import threading
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes are only serialized within one process
+    fcntl = None
+
+
+# One lock per tickets file, shared by every TicketTool instance in the process
+_file_locks: Dict[str, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def _lock_for(path: str) -> threading.Lock:
+    key = os.path.abspath(path)
+    with _file_locks_guard:
+        if key not in _file_locks:
+            _file_locks[key] = threading.Lock()
+        return _file_locks[key]
 
 
 class TicketTool:
-    """Tool for creating helpdesk tickets."""
+    """Tool for creating helpdesk tickets.
+
+    Ticket creation is serialized across threads with an in-process lock and
+    across processes with an flock on ``<tickets_file>.lock``. On platforms
+    without fcntl (Windows) only the in-process lock applies.
+    """
     
     def __init__(self, tickets_file: str = "./data/tickets.json"):
         self.tickets_file = tickets_file
+        self._lock = _lock_for(tickets_file)
         self._ensure_tickets_file()
+
+    @contextmanager
+    def _locked(self):
+        """Hold the in-process lock and, where supported, an exclusive file lock."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.tickets_file + ".lock", 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
     
     def _ensure_tickets_file(self):
         """Ensure tickets file exists."""
         os.makedirs(os.path.dirname(self.tickets_file) if os.path.dirname(self.tickets_file) else ".", exist_ok=True)
-        if not os.path.exists(self.tickets_file):
-            with open(self.tickets_file, 'w') as f:
-                json.dump({"tickets": []}, f)
+        with self._locked():
+            if not os.path.exists(self.tickets_file):
+                self._write_tickets({"tickets": []})
+
+    def _write_tickets(self, data: Dict):
+        """Write tickets atomically so concurrent readers never see a partial file."""
+        directory = os.path.dirname(os.path.abspath(self.tickets_file))
+        tmp_path = os.path.join(directory, f".tickets-{uuid.uuid4().hex}.tmp")
+        # 0o666 lets the kernel apply the umask, like a plain open(..., 'w')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            # Keep the mode of an existing tickets file
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(self.tickets_file).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, self.tickets_file)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
     
     def create_ticket(self, subject: str, description: str, priority: str = "medium", category: str = "general") -> Dict:
         """Create a helpdesk ticket."""
-        # Load existing tickets
-        with open(self.tickets_file, 'r') as f:
-            data = json.load(f)
-        
-        # Generate ticket ID
-        ticket_id = f"TKT-{len(data['tickets']) + 1:05d}"
-        
-        # Create ticket
-        ticket = {
-            "id": ticket_id,
-            "subject": subject,
-            "description": description,
-            "priority": priority.lower(),
-            "category": category.lower(),
-            "status": "open",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
-        
-        # Save ticket
-        data["tickets"].append(ticket)
-        with open(self.tickets_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        
+        # Serialize the read-modify-write so concurrent callers get unique IDs
+        with self._locked():
+            # Load existing tickets
+            with open(self.tickets_file, 'r') as f:
+                data = json.load(f)
+
+            # Generate ticket ID
+            ticket_id = f"TKT-{len(data['tickets']) + 1:05d}"
+
+            # Create ticket
+            ticket = {
+                "id": ticket_id,
+                "subject": subject,
+                "description": description,
+                "priority": priority.lower(),
+                "category": category.lower(),
+                "status": "open",
+                "created_at": datetime.now().isoformat(),
+                "updated_at": datetime.now().isoformat()
+            }
+
+            # Save ticket
+            data["tickets"].append(ticket)
+            self._write_tickets(data)
+
         return ticket
     
     def get_ticket(self, ticket_id: str) -> Dict:
@@ -27,6 +27,7 @@ class SimpleChatLLM:
         base_url: Optional[str],
         api_key: str,
         provider: str,
+        max_retries: Optional[int] = None,
     ):
         self.model = model
         self.temperature = temperature
@@ -35,7 +36,12 @@ class SimpleChatLLM:
         if provider == "deepseek" and base_url:
             if not base_url.endswith("/v1"):
                 base_url = base_url.rstrip("/") + "/v1"
-        self.client = OpenAI(api_key=api_key, base_url=base_url) if base_url else OpenAI(api_key=api_key)
+        client_kwargs = {"api_key": api_key}
+        if base_url:
+            client_kwargs["base_url"] = base_url
+        if max_retries is not None:
+            client_kwargs["max_retries"] = max_retries
+        self.client = OpenAI(**client_kwargs)
 
     def invoke(self, prompt_text: str):
         """Invoke the LLM with automatic model fallback for DeepSeek."""
@@ -70,9 +76,16 @@ class SimpleChatLLM:
         raise Exception(f"DeepSeek API error with all models: {last_error}")
 
 
+def get_llm_max_retries() -> Optional[int]:
+    """Client retry count from LLM_MAX_RETRIES, or None to keep the SDK default (2)."""
+    value = os.getenv("LLM_MAX_RETRIES")
+    return int(value) if value else None
+
+
 def get_chat_llm(model: Optional[str] = None, temperature: float = 0):
     """Get a lightweight chat client for the selected provider (OpenAI/DeepSeek)."""
     provider = get_llm_provider()
+    max_retries = get_llm_max_retries()
     if provider == "deepseek":
         api_key = os.getenv("DEEPSEEK_API_KEY", "")
         if not api_key:
@@ -80,11 +93,13 @@ def get_chat_llm(model: Optional[str] = None, temperature: float = 0):
         base_url = "https://api.deepseek.com/v1"
         # Default model - try common names
         default_model = model or os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
-        return SimpleChatLLM(default_model, temperature, base_url, api_key, provider="deepseek")
+        return SimpleChatLLM(default_model, temperature, base_url, api_key, provider="deepseek", max_retries=max_retries)
     else:
         api_key = os.getenv("OPENAI_API_KEY", "")
         default_model = model or "gpt-4o-mini"
-        return SimpleChatLLM(default_model, temperature, None, api_key, provider="openai")
+        # Optional override, e.g. a local OpenAI-compatible stub for load testing
+        base_url = os.getenv("OPENAI_BASE_URL") or None
+        return SimpleChatLLM(default_model, temperature, base_url, api_key, provider="openai", max_retries=max_retries)
 
 
 class SklearnTfidfEmbeddings:
@@ -0,0 +1,7 @@
+"""Shared pytest setup."""
+
+import os
+import sys
+
+# Make the `src` package importable when running `pytest tests/` from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,145 @@
+"""Tests for CorpusRegistry single-flight builds and LRU eviction."""
+
+import threading
+
+import pytest
+
+from src.tools.corpus_registry import CorpusRegistry
+
+
+def make_factory(size: int = 100):
+    """Return a RAGTool stand-in factory with its own build log and gates.
+
+    Paths starting with "bad" fail to build. ``gate(path)`` holds builds of
+    that path open until the returned gate's ``release`` event is set.
+    """
+    builds = []
+    builds_lock = threading.Lock()
+    gates = {}
+
+    class FakeIndex:
+        def initialize_vector_store(self, documents_path: str):
+            with builds_lock:
+                builds.append(documents_path)
+            gate = gates.get(documents_path)
+            if gate is not None:
+                gate["started"].set()
+                gate["release"].wait(timeout=5)
+            if documents_path.startswith("bad"):
+                raise ValueError(f"No documents found in {documents_path}")
+            self.documents_path = documents_path
+
+        def estimated_memory_bytes(self) -> int:
+            return size
+
+    def gate(path: str) -> dict:
+        gates[path] = {"started": threading.Event(), "release": threading.Event()}
+        return gates[path]
+
+    FakeIndex.builds = builds
+    FakeIndex.gate = staticmethod(gate)
+    return FakeIndex
+
+
+def run_threads(n, target):
+    results, errors = [], []
+    lock = threading.Lock()
+
+    def call():
+        try:
+            value = target()
+            with lock:
+                results.append(value)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    for t in threads:
+        t.start()
+    return threads, results, errors
+
+
+def test_concurrent_get_builds_once():
+    factory = make_factory()
+    registry = CorpusRegistry({"hr": "hr"}, rag_tool_factory=factory)
+    gate = factory.gate("hr")
+    threads, results, errors = run_threads(8, lambda: registry.get("hr"))
+    assert gate["started"].wait(timeout=5)
+    gate["release"].set()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert factory.builds == ["hr"]
+    assert len({id(r) for r in results}) == 1
+    assert registry.get("hr") is results[0]
+
+
+def test_build_error_reaches_waiters_and_is_not_cached():
+    factory = make_factory()
+    registry = CorpusRegistry({"x": "bad"}, rag_tool_factory=factory)
+    gate = factory.gate("bad")
+    threads, results, errors = run_threads(4, lambda: registry.get("x"))
+    assert gate["started"].wait(timeout=5)
+    gate["release"].set()
+    for t in threads:
+        t.join()
+
+    assert results == []
+    assert len(errors) == 4
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert registry.loaded() == []
+
+    with pytest.raises(ValueError):
+        registry.get("x")
+    assert factory.builds == ["bad", "bad"]
+
+
+def test_over_budget_evicts_lru_and_keeps_mru():
+    factory = make_factory(size=100)
+    registry = CorpusRegistry(
+        {"hr": "hr", "fin": "fin", "it": "it"}, max_memory_bytes=250, rag_tool_factory=factory
+    )
+    registry.get("hr")
+    registry.get("fin")
+    registry.get("hr")  # fin is now least recently used
+    registry.get("it")
+
+    assert registry.loaded() == ["hr", "it"]
+    assert registry.stats()["evictions"] == 1
+
+    registry.get("fin")
+    assert factory.builds == ["hr", "fin", "it", "fin"]
+
+
+def test_single_index_over_budget_is_kept():
+    registry = CorpusRegistry({"hr": "hr"}, max_memory_bytes=10, rag_tool_factory=make_factory(size=1000))
+    tool = registry.get("hr")
+    assert registry.loaded() == ["hr"]
+    assert registry.get("hr") is tool
+
+
+def test_register_during_build_does_not_return_stale_index():
+    factory = make_factory()
+    registry = CorpusRegistry({"b": "B"}, rag_tool_factory=factory)
+    gate = factory.gate("B")
+    threads, old_results, _ = run_threads(1, lambda: registry.get("b"))
+    assert gate["started"].wait(timeout=5)
+
+    registry.register("b", "B2")
+    fresh = registry.get("b")
+    gate["release"].set()
+    for t in threads:
+        t.join()
+
+    assert fresh.documents_path == "B2"
+    assert old_results[0].documents_path == "B"
+    assert registry.get("b") is fresh
+    assert registry.loaded() == ["b"]
+
+
+def test_unknown_corpus_raises():
+    registry = CorpusRegistry({}, rag_tool_factory=make_factory())
+    with pytest.raises(ValueError, match="Unknown corpus"):
+        registry.get("nope")
@@ -0,0 +1,82 @@
+"""Tests for the load-test runner."""
+
+import threading
+import time
+
+from src.loadtest.runner import load_workload, run_load_test, summarize, percentile
+
+
+class FakeOrchestrator:
+    """Records calls; queries containing 'fail' return success=False."""
+
+    def __init__(self, delay: float = 0.005):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def process(self, user_input: str):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return {"response": "ok", "success": "fail" not in user_input}
+
+
+WORKLOAD = [
+    {"kind": "policy", "query": "policy question"},
+    {"kind": "ticket", "query": "open a ticket"},
+    {"kind": "policy", "query": "policy fail"},
+]
+
+
+def test_closed_loop_runs_requested_count():
+    orchestrator = FakeOrchestrator()
+    run = run_load_test(orchestrator, WORKLOAD, concurrency=4, total_requests=30)
+
+    assert orchestrator.calls == 30
+    assert orchestrator.max_in_flight <= 4
+    summary = summarize(run)
+    assert summary["requests"] == 30
+    assert summary["errors"] == 10
+    assert summary["by_kind"]["ticket"]["requests"] == 10
+    assert summary["by_kind"]["policy"]["requests"] == 20
+
+
+def test_open_loop_follows_rate():
+    orchestrator = FakeOrchestrator()
+    run = run_load_test(orchestrator, WORKLOAD, concurrency=4, rate=200, total_requests=20)
+
+    assert orchestrator.calls == 20
+    # 20 requests at 200 req/s are scheduled over ~0.1s
+    assert run["elapsed"] >= 19 / 200
+    assert summarize(run)["requests"] == 20
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_load_workload_labels_and_classifies(tmp_path):
+    path = tmp_path / "workload.txt"
+    path.write_text(
+        "# comment\n"
+        "\n"
+        "ticket: Please set me up with VPN\n"
+        "policy: What is the broken-glass procedure?\n"
+        "My laptop is broken\n"
+        "How many vacation days do I get?\n"
+    )
+    assert load_workload(str(path)) == [
+        {"kind": "ticket", "query": "Please set me up with VPN"},
+        {"kind": "policy", "query": "What is the broken-glass procedure?"},
+        {"kind": "ticket", "query": "My laptop is broken"},
+        {"kind": "policy", "query": "How many vacation days do I get?"},
+    ]
@@ -0,0 +1,81 @@
+"""Tests for AgentOrchestrator routing and corpus selection."""
+
+from src.agent.orchestrator import AgentOrchestrator
+from src.tools.corpus_registry import CorpusRegistry
+
+
+class FakeRAG:
+    """Answers with the corpus it was built from."""
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self.questions = []
+
+    def initialize_vector_store(self, documents_path: str):
+        self.name = documents_path
+
+    def estimated_memory_bytes(self) -> int:
+        return 1
+
+    def query(self, question: str) -> dict:
+        self.questions.append(question)
+        return {"answer": f"answer from {self.name}", "sources": [f"{self.name}/policy.txt"]}
+
+
+class FakeTickets:
+    def create_ticket(self, subject, description, priority="medium", category="general"):
+        return {"id": "TKT-00001", "subject": subject, "status": "open"}
+
+
+def make_orchestrator(with_registry: bool = True):
+    registry = CorpusRegistry({"hr": "hr-policies", "fin": "fin-policies"}, rag_tool_factory=FakeRAG)
+    default = FakeRAG()
+    orchestrator = AgentOrchestrator(default, FakeTickets(), corpus_registry=registry if with_registry else None)
+    return orchestrator, default, registry
+
+
+def test_corpus_selector_uses_registry_index():
+    orchestrator, default, registry = make_orchestrator()
+    result = orchestrator.process("How many vacation days?", corpus="hr")
+
+    assert result["success"] is True
+    assert "answer from hr-policies" in result["response"]
+    assert "hr-policies/policy.txt" in result["response"]
+    assert registry.get("hr").questions == ["How many vacation days?"]
+    assert default.questions == []
+
+
+def test_no_corpus_uses_default_rag_tool():
+    orchestrator, default, registry = make_orchestrator()
+    result = orchestrator.process("How many vacation days?")
+
+    assert result["success"] is True
+    assert "answer from default" in result["response"]
+    assert default.questions == ["How many vacation days?"]
+    assert registry.loaded() == []
+
+
+def test_unknown_corpus_returns_error():
+    orchestrator, _, _ = make_orchestrator()
+    result = orchestrator.process("How many vacation days?", corpus="legal")
+
+    assert result["success"] is False
+    assert "Unknown corpus: legal" in result["response"]
+
+
+def test_corpus_without_registry_returns_error():
+    orchestrator, default, _ = make_orchestrator(with_registry=False)
+    result = orchestrator.process("How many vacation days?", corpus="hr")
+
+    assert result["success"] is False
+    assert "no corpus registry is configured" in result["response"]
+    assert default.questions == []
+
+
+def test_ticket_requests_ignore_corpus():
+    orchestrator, _, registry = make_orchestrator()
+    result = orchestrator.process("My laptop is broken", corpus="hr")
+
+    assert result["success"] is True
+    assert "TKT-00001" in result["response"]
+    assert registry.loaded() == []
@@ -0,0 +1,79 @@
+"""Tests for TicketTool under concurrent writes."""
+
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from src.tools.ticket_tool import TicketTool, fcntl
+
+
+def test_concurrent_create_ticket_gives_unique_ids(tmp_path):
+    tickets_file = str(tmp_path / "tickets.json")
+    tools = [TicketTool(tickets_file) for _ in range(4)]
+    n = 64
+    created = []
+    created_lock = threading.Lock()
+    start = threading.Barrier(n)
+
+    def create(i):
+        start.wait()
+        ticket = tools[i % len(tools)].create_ticket(subject=f"Subject {i}", description="Broken laptop")
+        with created_lock:
+            created.append(ticket["id"])
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with open(tickets_file) as f:
+        data = json.load(f)
+    ids = [t["id"] for t in data["tickets"]]
+    assert len(ids) == n
+    assert len(set(ids)) == n
+    assert sorted(created) == sorted(ids)
+
+
+def test_write_keeps_existing_file_mode(tmp_path):
+    tickets_file = tmp_path / "tickets.json"
+    tool = TicketTool(str(tickets_file))
+    tickets_file.chmod(0o640)
+    tool.create_ticket(subject="Monitor", description="New monitor")
+    assert tickets_file.stat().st_mode & 0o777 == 0o640
+
+
+def test_new_file_mode_follows_umask(tmp_path):
+    old_umask = os.umask(0o027)
+    try:
+        tickets_file = tmp_path / "tickets.json"
+        TicketTool(str(tickets_file))
+    finally:
+        os.umask(old_umask)
+    assert tickets_file.stat().st_mode & 0o777 == 0o640
+
+
+def _create_tickets_in_process(tickets_file, count):
+    tool = TicketTool(tickets_file)
+    for i in range(count):
+        tool.create_ticket(subject=f"Subject {i}", description="Access request")
+
+
+@pytest.mark.skipif(fcntl is None, reason="cross-process locking needs fcntl")
+def test_concurrent_processes_give_unique_ids(tmp_path):
+    tickets_file = str(tmp_path / "tickets.json")
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_create_tickets_in_process, args=(tickets_file, 25)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+
+    with open(tickets_file) as f:
+        ids = [t["id"] for t in json.load(f)["tickets"]]
+    assert len(ids) == 100
+    assert len(set(ids)) == 100